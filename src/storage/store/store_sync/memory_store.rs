@@ -159,12 +159,7 @@ impl WritableStorageTraits for MemoryStore {
 
     fn erase_prefix(&self, prefix: &StorePrefix) -> Result<(), StorageError> {
         let mut data_map = self.data_map.lock().unwrap();
-        let keys: Vec<StoreKey> = data_map.keys().cloned().collect();
-        for key in keys {
-            if key.has_prefix(prefix) {
-                data_map.remove(&key);
-            }
-        }
+        data_map.retain(|key, _| !key.has_prefix(prefix));
         Ok(())
     }
 }